@@ -0,0 +1,19 @@
+"""Print every job in the local queue database (debugging aid)."""
+
+from src.storage import Storage
+from src.utils import logger
+
+
+def main():
+    s = Storage()
+    jobs = s.list_jobs()
+
+    logger.info(f"Database path: {s.db_path}")
+    logger.info(f"Total jobs found: {len(jobs)}")
+
+    for j in jobs:
+        logger.info(f"Job {j['id']} - state={j['state']} attempts={j['attempts']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,7 @@ from setuptools import setup, find_packages
 setup(
     name="queuectl",
     version="1.0.0",
-    packages=find_packages(),
+    packages=find_packages(exclude=["scripts*"]),
     install_requires=[
         "click>=8.0.0",
     ],
@@ -1,20 +1,91 @@
 """CLI interface for QueueCTL."""
 
-import json
+import os
 import sys
 
 import click
 
-from .config import Config
-from .job_manager import JobManager
-from .storage import Storage
-from .worker import WorkerManager
+# Heavy submodules (storage, job manager, workers) are imported inside each
+# command so that `queuectl --help` and unrelated subcommands stay fast.
 
+# Commands that always run in the invoking process, never in the daemon
+_LOCAL_COMMANDS = {'daemon', 'worker'}
 
-@click.group()
-def cli():
+# Commands that read their input from stdin when given no SOURCE or '-'
+_STDIN_COMMANDS = {'enqueue-batch'}
+
+# Set while commands are being dispatched inside the daemon
+_IN_DAEMON = False
+
+
+# Rows formatted and written per echo call when listing jobs
+_OUTPUT_CHUNK = 1000
+
+
+def _echo_rows(rows, header, format_row, empty_message):
+    """
+    Print rows under a header, writing one chunk of lines at a time.
+    
+    Memory stays bounded by the chunk size however many rows there are.
+    """
+    from itertools import islice
+
+    rows = iter(rows)
+    printed_header = False
+    while True:
+        lines = [format_row(row) for row in islice(rows, _OUTPUT_CHUNK)]
+        if not lines:
+            break
+        if not printed_header:
+            lines[:0] = [header, "-" * 70]
+            printed_header = True
+        click.echo("\n".join(lines))
+
+    if not printed_header:
+        click.echo(empty_message)
+
+
+class _ForwardingGroup(click.Group):
+    """Root group that remembers the arguments it was invoked with."""
+
+    def parse_args(self, ctx, args):
+        # main() fills args from sys.argv only for the console-script entry;
+        # programmatic callers pass their own, and those are what the daemon
+        # must run
+        ctx.meta['queuectl.args'] = args[:]
+        return super().parse_args(ctx, args)
+
+
+@click.group(cls=_ForwardingGroup)
+@click.pass_context
+def cli(ctx):
     """QueueCTL - Production-grade CLI-based background job queue system."""
-    pass
+    if _IN_DAEMON or ctx.invoked_subcommand in _LOCAL_COMMANDS:
+        return
+
+    # Hand the command to a running daemon, if any, to skip startup costs
+    sock_path = os.path.join(os.path.expanduser('~'), '.queuectl', 'ctl.sock')
+    if not os.path.exists(sock_path):
+        return
+
+    from .daemon import forward
+
+    args = ctx.meta['queuectl.args']
+
+    stdin = None
+    if ctx.invoked_subcommand in _STDIN_COMMANDS and not sys.stdin.isatty():
+        # Only slurp stdin when the command will actually read it; the group
+        # takes no options, so the subcommand name is always args[0]
+        if args[1:] in ([], ['-']):
+            stdin = sys.stdin.read()
+
+    response = forward(args, stdin)
+    if response is None:
+        return  # daemon unreachable: run inline
+
+    sys.stdout.write(response['stdout'])
+    sys.stderr.write(response['stderr'])
+    ctx.exit(response['exit_code'])
 
 
 @cli.command()
@@ -27,9 +98,13 @@ def enqueue(job_json):
     
     Example: queuectl enqueue '{"id":"job1","command":"sleep 2"}'
     """
+    import json
+
+    from .job_manager import get_manager
+
     try:
         job_data = json.loads(job_json)
-        manager = JobManager()
+        manager = get_manager()
         job = manager.enqueue(job_data)
         
         click.echo(f"✓ Job enqueued successfully")
@@ -47,6 +122,64 @@ def enqueue(job_json):
         sys.exit(1)
 
 
+@cli.command('enqueue-batch')
+@click.argument('source', type=click.File('r'), default='-')
+def enqueue_batch(source):
+    """
+    Enqueue many jobs in one transaction.
+    
+    SOURCE: File with a JSON array of jobs or one JSON job per line
+    (default: stdin)
+    
+    Example: cat jobs.ndjson | queuectl enqueue-batch
+    """
+    import json
+
+    from .job_manager import get_manager
+
+    try:
+        text = source.read().strip()
+        if text.startswith('['):
+            jobs_data = json.loads(text)
+        else:
+            jobs_data = [json.loads(line) for line in text.splitlines() if line.strip()]
+        
+        manager = get_manager()
+        jobs = manager.enqueue_many(jobs_data)
+        
+        click.echo(f"✓ Enqueued {len(jobs)} jobs")
+    except json.JSONDecodeError:
+        click.echo("✗ Error: Invalid JSON format", err=True)
+        sys.exit(1)
+    except ValueError as e:
+        click.echo(f"✗ Error: {e}", err=True)
+        sys.exit(1)
+    except Exception as e:
+        click.echo(f"✗ Error: {e}", err=True)
+        sys.exit(1)
+
+
+@cli.command()
+def daemon():
+    """
+    Serve commands from a long-running process.
+    
+    While the daemon runs, other queuectl invocations are forwarded to it
+    over ~/.queuectl/ctl.sock instead of doing the work themselves.
+    """
+    global _IN_DAEMON
+    from .daemon import serve
+
+    try:
+        _IN_DAEMON = True
+        serve(cli)
+    except RuntimeError as e:
+        click.echo(f"✗ Error: {e}", err=True)
+        sys.exit(1)
+    finally:
+        _IN_DAEMON = False
+
+
 @cli.group()
 def worker():
     """Manage worker processes."""
@@ -55,12 +188,17 @@ def worker():
 
 @worker.command()
 @click.option('--count', default=3, help='Number of workers to start')
-def start(count):
+@click.option('--mode', type=click.Choice(['process', 'async']), default='process',
+              help='One process per worker, or all workers as async tasks in one process')
+def start(count, mode):
     """Start worker processes."""
+    from .worker import WorkerManager
+
     try:
         manager = WorkerManager()
-        manager.start_workers(count)
+        manager.start_workers(count, mode)
         click.echo(f"✓ Started {count} workers")
+        manager.wait()
     except RuntimeError as e:
         click.echo(f"✗ Error: {e}", err=True)
         sys.exit(1)
@@ -72,6 +210,8 @@ def start(count):
 @worker.command()
 def stop():
     """Stop all worker processes."""
+    from .worker import WorkerManager
+
     try:
         manager = WorkerManager()
         manager.stop_workers()
@@ -84,16 +224,19 @@ def stop():
 @cli.command()
 def status():
     """Show queue status."""
+    from .job_manager import get_manager
+
     try:
-        manager = JobManager()
+        manager = get_manager()
         status = manager.get_status()
         
-        click.echo("Queue Status:")
-        click.echo("─" * 40)
-        for state, count in status.items():
-            click.echo(f"  {state.capitalize():12s}: {count:5d}")
-        click.echo("─" * 40)
-        click.echo(f"  {'Total':12s}: {sum(status.values()):5d}")
+        click.echo("\n".join([
+            "Queue Status:",
+            "─" * 40,
+            *(f"  {state.capitalize():12s}: {count:5d}" for state, count in status.items()),
+            "─" * 40,
+            f"  {'Total':12s}: {sum(status.values()):5d}",
+        ]))
     except Exception as e:
         click.echo(f"✗ Error: {e}", err=True)
         sys.exit(1)
@@ -105,20 +248,20 @@ def status():
 
 @cli.command()
 @click.option('--state', default=None, help='Filter jobs by state (pending, processing, completed, failed, dead)')
-def list(state):
+@click.option('--limit', type=click.IntRange(min=0), default=None, help='Maximum number of jobs to show')
+@click.option('--offset', type=click.IntRange(min=0), default=0, help='Number of jobs to skip')
+def list(state, limit, offset):
     """List jobs in the queue."""
-    try:
-        manager = JobManager()
-        jobs = manager.list_jobs(state)
-
-        if not jobs:
-            click.echo("No jobs found.")
-            return
+    from .job_manager import get_manager
 
-        click.echo(f"{'ID':<20} {'STATE':<12} {'ATTEMPTS':<9} {'COMMAND'}")
-        click.echo("-" * 70)
-        for job in jobs:
-            click.echo(f"{job['id']:<20} {job['state']:<12} {job['attempts']:<9} {job['command']}")
+    try:
+        manager = get_manager()
+        _echo_rows(
+            manager.iter_jobs_brief(state, limit, offset),
+            f"{'ID':<20} {'STATE':<12} {'ATTEMPTS':<9} {'COMMAND'}",
+            lambda job: f"{job[0]:<20} {job[1]:<12} {job[2]:<9} {job[3]}",
+            "No jobs found."
+        )
     except Exception as e:
         click.echo(f"✗ Error: {e}", err=True)
         sys.exit(1)
@@ -131,20 +274,20 @@ def dlq():
 
 
 @dlq.command('list')
-def dlq_list():
+@click.option('--limit', type=click.IntRange(min=0), default=None, help='Maximum number of jobs to show')
+@click.option('--offset', type=click.IntRange(min=0), default=0, help='Number of jobs to skip')
+def dlq_list(limit, offset):
     """List jobs in the Dead Letter Queue."""
-    try:
-        manager = JobManager()
-        jobs = manager.list_jobs('dead')
-
-        if not jobs:
-            click.echo("No jobs in Dead Letter Queue.")
-            return
+    from .job_manager import get_manager
 
-        click.echo(f"{'ID':<20} {'ATTEMPTS':<9} {'COMMAND'}")
-        click.echo("-" * 70)
-        for job in jobs:
-            click.echo(f"{job['id']:<20} {job['attempts']:<9} {job['command']}")
+    try:
+        manager = get_manager()
+        _echo_rows(
+            manager.iter_jobs_brief('dead', limit, offset),
+            f"{'ID':<20} {'ATTEMPTS':<9} {'COMMAND'}",
+            lambda job: f"{job[0]:<20} {job[2]:<9} {job[3]}",
+            "No jobs in Dead Letter Queue."
+        )
     except Exception as e:
         click.echo(f"✗ Error: {e}", err=True)
         sys.exit(1)
@@ -154,8 +297,10 @@ def dlq_list():
 @click.argument('job_id')
 def dlq_retry(job_id):
     """Retry a specific job from the Dead Letter Queue."""
+    from .job_manager import get_manager
+
     try:
-        manager = JobManager()
+        manager = get_manager()
         manager.retry_from_dlq(job_id)
         click.echo(f"✓ Job {job_id} retried from DLQ.")
     except Exception as e:
@@ -169,21 +314,27 @@ def config():
     pass
 
 
+def _parse_config_value(value):
+    """Convert a CLI config value to int or float when it looks numeric."""
+    try:
+        return int(value)
+    except ValueError:
+        try:
+            return float(value)
+        except ValueError:
+            return value
+
+
 @config.command('set')
 @click.argument('key')
 @click.argument('value')
 def config_set(key, value):
     """Set a configuration key."""
+    from .config import Config
+
     try:
         cfg = Config()
-        # Try to convert numeric values
-        try:
-            value = int(value)
-        except ValueError:
-            try:
-                value = float(value)
-            except ValueError:
-                pass
+        value = _parse_config_value(value)
         cfg.set(key, value)
         click.echo(f"✓ Configuration updated: {key} = {value}")
     except Exception as e:
@@ -191,16 +342,48 @@ def config_set(key, value):
         sys.exit(1)
 
 
+@config.command('set-many')
+@click.argument('pairs', nargs=-1, required=True)
+def config_set_many(pairs):
+    """
+    Set several configuration keys at once.
+    
+    PAIRS: One or more KEY=VALUE assignments
+    
+    Example: queuectl config set-many max_retries=5 backoff_base=3
+    """
+    from .config import Config
+
+    try:
+        values = {}
+        for pair in pairs:
+            key, sep, value = pair.partition('=')
+            if not sep or not key:
+                raise ValueError(f"Expected KEY=VALUE, got '{pair}'")
+            values[key] = _parse_config_value(value)
+        
+        cfg = Config()
+        cfg.set_many(values)
+        for key, value in values.items():
+            click.echo(f"✓ Configuration updated: {key} = {value}")
+    except Exception as e:
+        click.echo(f"✗ Error: {e}", err=True)
+        sys.exit(1)
+
+
 @config.command('show')
 def config_show():
     """Display current configuration."""
+    from .config import Config
+
     try:
         cfg = Config()
         data = cfg.get_all()
-        click.echo("Current Configuration:")
-        click.echo("-" * 40)
-        for k, v in data.items():
-            click.echo(f"{k:20s}: {v}")
+        click.echo("\n".join([
+            "Current Configuration:",
+            "-" * 40,
+            *(f"{k:20s}: {v}" for k, v in data.items()),
+        ]))
     except Exception as e:
         click.echo(f"✗ Error: {e}", err=True)
         sys.exit(1)
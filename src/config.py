@@ -2,6 +2,7 @@
 
 import json
 import os
+import tempfile
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -16,7 +17,15 @@ class Config:
     DEFAULT_CONFIG = {
         "max_retries": 3,
         "backoff_base": 2.0,
+        "backoff_cap": 300.0,
         "worker_poll_interval": 1.0,
+        "worker_concurrency": 1,
+        "local_queue_size": 1,
+        "complete_batch_delay_ms": 0,
+        "complete_batch_max": 100,
+        "worker_stop_timeout": 10.0,
+        "job_timeout": 300.0,
+        "log_retention": "all",
         "data_dir": ".queuectl",
     }
     
@@ -55,14 +64,34 @@ class Config:
             return self.DEFAULT_CONFIG.copy()
     
     def _save_config(self) -> None:
-        """Save configuration to file."""
+        """Save configuration to file atomically (write temp file, then rename)."""
+        tmp_path = None
         try:
-            os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
-            with open(self.config_path, 'w') as f:
-                json.dump(self._config, f, indent=2)
+            config_dir = os.path.dirname(self.config_path)
+            os.makedirs(config_dir, exist_ok=True)
+            
+            # A unique temp file per writer, so concurrent saves never
+            # truncate each other's file before it is renamed into place
+            fd, tmp_path = tempfile.mkstemp(
+                dir=config_dir, prefix=".config-", suffix=".tmp"
+            )
+            with os.fdopen(fd, 'w') as f:
+                if hasattr(os, "fchmod"):
+                    os.fchmod(f.fileno(), 0o644)  # mkstemp creates files as 0600
+                json.dump(self._config, f, separators=(',', ':'))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.config_path)
+            tmp_path = None
         except Exception as e:
             logger.error(f"Failed to save config: {e}")
             raise
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
     
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -89,6 +118,17 @@ class Config:
         self._save_config()
         logger.info(f"Configuration updated: {key} = {value}")
     
+    def set_many(self, values: Dict[str, Any]) -> None:
+        """
+        Set several configuration values and persist them in one write.
+        
+        Args:
+            values: Mapping of configuration keys to values
+        """
+        self._config.update(values)
+        self._save_config()
+        logger.info(f"Configuration updated: {values}")
+    
     def get_all(self) -> Dict[str, Any]:
         """
         Get all configuration values.
@@ -0,0 +1,226 @@
+"""Command daemon that serves CLI invocations over a Unix socket."""
+
+import io
+import json
+import logging
+import os
+import signal
+import socket
+import sys
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import click
+
+from .utils import logger
+
+
+class _Stop(BaseException):
+    """Raised by the signal handler to leave the serve loop."""
+
+
+def get_socket_path() -> Path:
+    """
+    Get the path of the daemon control socket.
+
+    Returns:
+        Socket path (~/.queuectl/ctl.sock)
+    """
+    return Path.home() / ".queuectl" / "ctl.sock"
+
+
+def _send_message(conn: socket.socket, message: Dict) -> None:
+    """Send one newline-terminated JSON message."""
+    conn.sendall(json.dumps(message).encode("utf-8") + b"\n")
+
+
+def _recv_message(conn: socket.socket) -> Optional[Dict]:
+    """Receive one newline-terminated JSON message (None on EOF)."""
+    with conn.makefile("rb") as f:
+        line = f.readline()
+    return json.loads(line) if line else None
+
+
+def forward(
+    args: List[str],
+    stdin: Optional[str] = None,
+    path: Optional[Path] = None
+) -> Optional[Dict]:
+    """
+    Run a command in the daemon instead of in this process.
+
+    Args:
+        args: Command line arguments (without the program name)
+        stdin: Standard input to hand to the command, if any
+        path: Socket path (default: get_socket_path())
+
+    Returns:
+        Response with 'stdout', 'stderr' and 'exit_code', or None if no
+        daemon is reachable (the caller should then run the command inline)
+    """
+    path = path or get_socket_path()
+
+    try:
+        conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    except (AttributeError, OSError):
+        return None
+
+    with conn:
+        try:
+            conn.connect(str(path))
+        except OSError:
+            # Stale socket file or daemon not running
+            return None
+
+        _send_message(conn, {"args": args, "stdin": stdin, "cwd": os.getcwd()})
+        conn.shutdown(socket.SHUT_WR)
+        return _recv_message(conn)
+
+
+def _dispatch(cli: click.Group, request: Dict) -> Dict:
+    """
+    Run one CLI invocation in-process, capturing its output.
+
+    Args:
+        cli: Root click group
+        request: Request with 'args', optional 'stdin' and 'cwd'
+
+    Returns:
+        Response dictionary
+    """
+    out, err = io.StringIO(), io.StringIO()
+    saved_stdin, saved_cwd = sys.stdin, os.getcwd()
+    exit_code = 0
+
+    # Log records go to the client's stdout, as they would inline
+    log_handlers = [
+        h for h in logger.handlers if isinstance(h, logging.StreamHandler)
+    ]
+    saved_streams = [h.stream for h in log_handlers]
+
+    try:
+        sys.stdin = io.StringIO(request.get("stdin") or "")
+        for handler in log_handlers:
+            handler.setStream(out)
+        if request.get("cwd"):
+            os.chdir(request["cwd"])
+
+        with redirect_stdout(out), redirect_stderr(err):
+            try:
+                cli.main(
+                    args=request["args"],
+                    prog_name="queuectl",
+                    standalone_mode=False
+                )
+            except click.exceptions.Exit as e:
+                exit_code = e.exit_code
+            except click.ClickException as e:
+                e.show()
+                exit_code = e.exit_code
+            except click.exceptions.Abort:
+                click.echo("Aborted!", err=True)
+                exit_code = 1
+            except SystemExit as e:
+                if e.code is None:
+                    exit_code = 0
+                elif isinstance(e.code, int):
+                    exit_code = e.code
+                else:
+                    click.echo(str(e.code), err=True)
+                    exit_code = 1
+            except Exception:
+                traceback.print_exc()
+                exit_code = 1
+    finally:
+        for handler, stream in zip(log_handlers, saved_streams):
+            handler.setStream(stream)
+        sys.stdin = saved_stdin
+        os.chdir(saved_cwd)
+
+    return {
+        "stdout": out.getvalue(),
+        "stderr": err.getvalue(),
+        "exit_code": exit_code,
+    }
+
+
+def serve(cli: click.Group, path: Optional[Path] = None) -> None:
+    """
+    Serve CLI commands on a Unix socket until terminated.
+
+    Requests are handled one at a time, so commands never run concurrently
+    inside the daemon. SIGTERM or SIGINT during a request lets that request
+    finish and answer its client before the daemon stops.
+
+    Args:
+        cli: Root click group to dispatch commands to
+        path: Socket path (default: get_socket_path())
+
+    Raises:
+        RuntimeError: If Unix sockets are unsupported or a daemon is
+            already listening on the path
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        raise RuntimeError("Daemon mode requires Unix domain sockets")
+
+    path = path or get_socket_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    if path.exists():
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(str(path))
+        except OSError:
+            path.unlink()  # left behind by a daemon that did not exit cleanly
+        else:
+            raise RuntimeError(f"Daemon already running on {path}")
+        finally:
+            probe.close()
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+    # Stop at once while idle; while a request is in flight only note the
+    # signal, since raising inside a command would be caught there and
+    # reported to the client as its exit status
+    state = {"busy": False, "stop": False}
+
+    def handle_stop(signum, frame):
+        if not state["busy"]:
+            raise _Stop()
+        state["stop"] = True
+
+    saved_handlers = {
+        signum: signal.signal(signum, handle_stop)
+        for signum in (signal.SIGTERM, signal.SIGINT)
+    }
+
+    try:
+        server.bind(str(path))
+        os.chmod(path, 0o600)
+        server.listen()
+        # Also sets up the log handler on the real stdout before any request
+        # redirects it
+        logger.info(f"Daemon listening on {path}")
+
+        while not state["stop"]:
+            conn, _ = server.accept()
+            state["busy"] = True
+            with conn:
+                try:
+                    request = _recv_message(conn)
+                    if request is not None:
+                        _send_message(conn, _dispatch(cli, request))
+                except (OSError, ValueError) as e:
+                    logger.error(f"Daemon request failed: {e}")
+            state["busy"] = False
+    except _Stop:
+        pass
+    finally:
+        for signum, handler in saved_handlers.items():
+            signal.signal(signum, handler)
+        server.close()
+        if path.exists():
+            path.unlink()
+        logger.info("Daemon stopped")
@@ -1,12 +1,22 @@
 """Job management and state transitions."""
 
 import json
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from .config import Config
 from .storage import Storage
-from .utils import calculate_backoff_delay, get_timestamp, logger
+from .utils import calculate_backoff_delay, command_argv, get_timestamp, logger
+
+
+def _is_duplicate_id(error: sqlite3.IntegrityError) -> bool:
+    """Check whether an IntegrityError is a job ID (primary key) collision."""
+    name = getattr(error, "sqlite_errorname", None)  # Python 3.11+
+    if name is not None:
+        return name in ("SQLITE_CONSTRAINT_PRIMARYKEY", "SQLITE_CONSTRAINT_UNIQUE")
+    return "UNIQUE constraint failed" in str(error)
 
 
 class JobManager:
@@ -27,31 +37,34 @@ class JobManager:
         self.storage = storage or Storage()
         self.config = config or Config()
     
-    def enqueue(self, job_data: Dict) -> Dict:
+    def _build_job(self, job_data: Dict, now: str) -> Dict:
         """
-        Enqueue a new job.
+        Validate job data and build a new pending job record.
         
         Args:
             job_data: Job data containing at least 'id' and 'command'
+            now: Timestamp used for created_at/updated_at
             
         Returns:
-            Created job dictionary
+            Job dictionary ready for insertion
             
         Raises:
-            ValueError: If job data is invalid or job ID already exists
+            ValueError: If job data is invalid
         """
         # Validate required fields
         if 'id' not in job_data or 'command' not in job_data:
             raise ValueError("Job must have 'id' and 'command' fields")
         
-        # Check for duplicate ID
-        existing = self.storage.get_job(job_data['id'])
-        if existing:
-            raise ValueError(f"Job with ID '{job_data['id']}' already exists")
+        command = job_data['command']
+        if not isinstance(command, str) or not command.strip():
+            raise ValueError("Job 'command' must be a non-empty string")
+        
+        # Split simple commands once here so workers can exec them
+        # directly without a shell
+        argv = command_argv(job_data['command'])
         
         # Create job with defaults
-        now = get_timestamp()
-        job = {
+        return {
             'id': job_data['id'],
             'command': job_data['command'],
             'state': 'pending',
@@ -61,14 +74,74 @@ class JobManager:
             'updated_at': now,
             'scheduled_at': job_data.get('scheduled_at'),
             'error_message': None,
-            'lock_id': None
+            'lock_id': None,
+            'argv': json.dumps(argv) if argv is not None else None
         }
+    
+    def enqueue(self, job_data: Dict) -> Dict:
+        """
+        Enqueue a new job.
         
-        self.storage.create_job(job)
+        Args:
+            job_data: Job data containing at least 'id' and 'command'
+            
+        Returns:
+            Created job dictionary
+            
+        Raises:
+            ValueError: If job data is invalid or job ID already exists
+        """
+        job = self._build_job(job_data, get_timestamp())
+        
+        # The primary key rejects duplicate IDs; no need for a lookup first
+        try:
+            self.storage.create_job(job)
+        except sqlite3.IntegrityError as e:
+            if not _is_duplicate_id(e):
+                raise
+            raise ValueError(f"Job with ID '{job['id']}' already exists")
+        self.storage.notify_job_ready()
         logger.info(f"Job enqueued: {job['id']}")
         
         return job
     
+    def enqueue_many(self, jobs_data: List[Dict]) -> List[Dict]:
+        """
+        Enqueue a batch of jobs in a single transaction.
+        
+        Either every job is enqueued or none are.
+        
+        Args:
+            jobs_data: List of job data dictionaries
+            
+        Returns:
+            List of created job dictionaries
+            
+        Raises:
+            ValueError: If any job is invalid or any job ID already exists
+        """
+        now = get_timestamp()
+        jobs = [self._build_job(job_data, now) for job_data in jobs_data]
+        
+        seen = set()
+        for job in jobs:
+            if job['id'] in seen:
+                raise ValueError(f"Duplicate job ID in batch: '{job['id']}'")
+            seen.add(job['id'])
+        
+        try:
+            self.storage.create_jobs(jobs)
+        except sqlite3.IntegrityError as e:
+            if not _is_duplicate_id(e):
+                raise
+            raise ValueError(
+                "Batch contains job IDs that already exist; nothing was enqueued"
+            )
+        self.storage.notify_job_ready()
+        logger.info(f"Batch enqueued: {len(jobs)} jobs")
+        
+        return jobs
+    
     def get_job(self, job_id: str) -> Optional[Dict]:
         """
         Get job by ID.
@@ -81,20 +154,70 @@ class JobManager:
         """
         return self.storage.get_job(job_id)
     
-    def list_jobs(self, state: Optional[str] = None) -> List[Dict]:
+    def _validate_state(self, state: Optional[str]) -> None:
+        """Raise ValueError if state is set but not a known job state."""
+        if state and state not in self.VALID_STATES:
+            raise ValueError(f"Invalid state: {state}")
+    
+    def list_jobs(
+        self,
+        state: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[Dict]:
         """
         List jobs, optionally filtered by state.
         
         Args:
             state: Filter by job state
+            limit: Maximum number of jobs to return
+            offset: Number of jobs to skip
             
         Returns:
             List of job dictionaries
         """
-        if state and state not in self.VALID_STATES:
-            raise ValueError(f"Invalid state: {state}")
+        self._validate_state(state)
+        return self.storage.list_jobs(state, limit, offset)
+    
+    def iter_jobs(
+        self,
+        state: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> Iterator[Dict]:
+        """
+        Iterate over jobs without materializing the full list.
         
-        return self.storage.list_jobs(state)
+        Args:
+            state: Filter by job state
+            limit: Maximum number of jobs to return
+            offset: Number of jobs to skip
+            
+        Returns:
+            Iterator of job dictionaries
+        """
+        self._validate_state(state)
+        return self.storage.iter_jobs(state, limit, offset)
+    
+    def iter_jobs_brief(
+        self,
+        state: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> Iterator[Tuple[str, str, int, str]]:
+        """
+        Iterate over jobs as (id, state, attempts, command) tuples.
+        
+        Args:
+            state: Filter by job state
+            limit: Maximum number of jobs to return
+            offset: Number of jobs to skip
+            
+        Returns:
+            Iterator of job tuples
+        """
+        self._validate_state(state)
+        return self.storage.iter_jobs_brief(state, limit, offset)
     
     def mark_completed(self, job_id: str) -> None:
         """
@@ -109,49 +232,100 @@ class JobManager:
         })
         logger.info(f"Job completed: {job_id}")
     
-    def mark_failed(self, job_id: str, error_message: str) -> None:
+    def mark_completed_many(self, job_ids: List[str], lock_id: str) -> None:
         """
-        Mark a job as failed and handle retry logic.
+        Mark several jobs as completed and release their locks in one
+        transaction.
         
         Args:
-            job_id: Job identifier
-            error_message: Error description
+            job_ids: Job identifiers
+            lock_id: Lock identifier held on the jobs
         """
-        job = self.storage.get_job(job_id)
-        if not job:
-            logger.error(f"Job not found: {job_id}")
-            return
+        self.storage.mark_completed_many(job_ids, lock_id)
+        logger.info(f"Jobs completed: {', '.join(job_ids)}")
+    
+    def _failure_update(self, job: Dict, error_message: str) -> Dict:
+        """
+        Compute the retry or dead-letter update for a failed job.
         
+        Args:
+            job: Job dictionary as it was before this failure
+            error_message: Error description
+            
+        Returns:
+            Dictionary of fields to update (always the same keys)
+        """
+        job_id = job['id']
         attempts = job['attempts'] + 1
         max_retries = job['max_retries']
         
         if attempts >= max_retries:
             # Move to dead letter queue
-            self.storage.update_job(job_id, {
-                'state': 'dead',
-                'attempts': attempts,
-                'error_message': error_message,
-                'lock_id': None
-            })
             logger.warning(f"Job moved to DLQ after {attempts} attempts: {job_id}")
-        else:
-            # Schedule retry with exponential backoff
-            backoff_base = self.config.get('backoff_base')
-            delay = calculate_backoff_delay(attempts, backoff_base)
-            scheduled_at = (
-                datetime.utcnow() + timedelta(seconds=delay)
-            ).isoformat()
-            
-            self.storage.update_job(job_id, {
-                'state': 'pending',
+            return {
+                'state': 'dead',
                 'attempts': attempts,
                 'error_message': error_message,
-                'scheduled_at': scheduled_at,
+                'scheduled_at': job.get('scheduled_at'),
+                'last_delay': job.get('last_delay'),
                 'lock_id': None
-            })
-            logger.info(
-                f"Job scheduled for retry #{attempts} in {delay}s: {job_id}"
-            )
+            }
+        
+        # Schedule retry with jittered exponential backoff
+        delay = calculate_backoff_delay(
+            attempts,
+            self.config.get('backoff_base'),
+            self.config.get('backoff_cap'),
+            job.get('last_delay')
+        )
+        scheduled_at = (
+            datetime.now(timezone.utc) + timedelta(seconds=delay)
+        ).isoformat(timespec='microseconds')
+        
+        logger.info(
+            f"Job scheduled for retry #{attempts} in {delay:.1f}s: {job_id}"
+        )
+        return {
+            'state': 'pending',
+            'attempts': attempts,
+            'error_message': error_message,
+            'scheduled_at': scheduled_at,
+            'last_delay': delay,
+            'lock_id': None
+        }
+    
+    def mark_failed(self, job_id: str, error_message: str) -> None:
+        """
+        Mark a job as failed and handle retry logic.
+        
+        Args:
+            job_id: Job identifier
+            error_message: Error description
+        """
+        job = self.storage.get_job(job_id)
+        if not job:
+            logger.error(f"Job not found: {job_id}")
+            return
+        
+        self.storage.update_job(job_id, self._failure_update(job, error_message))
+    
+    def mark_failed_many(
+        self,
+        failures: List[Tuple[Dict, str]],
+        lock_id: str
+    ) -> None:
+        """
+        Apply retry logic to several failed jobs in one transaction.
+        
+        Args:
+            failures: (job, error_message) pairs, where job is the record
+                the worker claimed
+            lock_id: Lock identifier held on the jobs
+        """
+        self.storage.mark_failed_many([
+            (job['id'], self._failure_update(job, error_message))
+            for job, error_message in failures
+        ], lock_id)
     
     def retry_from_dlq(self, job_id: str) -> None:
         """
@@ -175,8 +349,10 @@ class JobManager:
             'attempts': 0,
             'error_message': None,
             'scheduled_at': None,
+            'last_delay': None,
             'lock_id': None
         })
+        self.storage.notify_job_ready()
         logger.info(f"Job retried from DLQ: {job_id}")
     
     def get_status(self) -> Dict[str, int]:
@@ -187,9 +363,26 @@ class JobManager:
             Dictionary mapping state to count
         """
         status = {state: 0 for state in self.VALID_STATES}
-        
-        for state in self.VALID_STATES:
-            jobs = self.storage.list_jobs(state)
-            status[state] = len(jobs)
+        status.update(self.storage.count_by_state())
         
         return status
+
+
+@lru_cache(maxsize=1)
+def _shared_storage() -> Storage:
+    """Get the process-wide Storage instance (and its open connection)."""
+    return Storage()
+
+
+def get_manager() -> JobManager:
+    """
+    Get a JobManager for one command.
+    
+    The storage is shared process-wide so a long-running daemon keeps its
+    connection; the config is re-read on every call so changes made since
+    the previous command (e.g. `config set`) take effect.
+    
+    Returns:
+        JobManager backed by the shared storage and the current config
+    """
+    return JobManager(_shared_storage())
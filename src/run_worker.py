@@ -3,3 +3,4 @@ from src.worker import WorkerManager
 if __name__ == "__main__":
     manager = WorkerManager()
     manager.start_workers(1)
+    manager.wait()
@@ -1,21 +1,81 @@
 """Persistent storage layer using SQLite."""
 
+import asyncio
 import json
+import os
+import select
+import socket
 import sqlite3
 import threading
+import time
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, Iterator, List, Optional, Set, Tuple
 
 from .utils import get_timestamp, logger
 
 
+# Columns that may be changed through Storage.update_job
+_UPDATABLE_FIELDS = frozenset({
+    'state', 'attempts', 'error_message', 'scheduled_at', 'lock_id',
+    'command', 'max_retries', 'last_delay', 'argv',
+})
+
+# Columns added after the original schema, created on first open if missing
+_ADDED_COLUMNS = {
+    'last_delay': 'REAL',
+    'argv': 'TEXT',
+}
+
+# UPDATE statements keyed by the set of columns being changed
+_UPDATE_TEMPLATES: Dict[FrozenSet[str], Tuple[Tuple[str, ...], str]] = {}
+
+
+_JOB_COLUMNS = "*"
+_BRIEF_COLUMNS = "id, state, attempts, command"
+
+
+def _build_list_sql(columns: str, filtered: bool, paged: bool) -> str:
+    """Build a job listing query for one (columns, filter, paging) shape."""
+    sql = f"SELECT {columns} FROM jobs"
+    if filtered:
+        sql += " WHERE state = ?"
+    sql += " ORDER BY created_at"
+    if paged:
+        sql += " LIMIT ? OFFSET ?"
+    return sql
+
+
+# Every listing query shape, built once at import time
+_LIST_SQL: Dict[Tuple[str, bool, bool], str] = {
+    (columns, filtered, paged): _build_list_sql(columns, filtered, paged)
+    for columns in (_JOB_COLUMNS, _BRIEF_COLUMNS)
+    for filtered in (False, True)
+    for paged in (False, True)
+}
+
+
+def _dict_factory(cursor: sqlite3.Cursor, row: tuple) -> Dict:
+    """Row factory that builds plain dicts straight from result tuples."""
+    return {col[0]: value for col, value in zip(cursor.description, row)}
+
+
 class Storage:
     """
     SQLite-based persistent storage for jobs.
     Thread-safe with connection pooling per thread.
     """
     
+    # Database paths whose schema has already been ensured in this process
+    _initialized: Set[str] = set()
+    
+    _INSERT_JOB_SQL = """
+        INSERT INTO jobs 
+        (id, command, state, attempts, max_retries, 
+         created_at, updated_at, scheduled_at, error_message, lock_id, argv)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    
     def __init__(self, db_path: Optional[str] = None):
         """
         Initialize storage layer.
@@ -30,7 +90,17 @@ class Storage:
         
         self.db_path = db_path
         self._local = threading.local()
-        self._init_db()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._wake_dir = Path(db_path).parent / "wake"
+        self._wake_sock: Optional[socket.socket] = None
+        self._wake_path: Optional[Path] = None
+        # Set once binding the waiter socket fails; waits then just sleep
+        self._wake_unavailable = False
+        
+        if db_path not in Storage._initialized:
+            self._init_db()
+            Storage._initialized.add(db_path)
     
     def _get_connection(self) -> sqlite3.Connection:
         """
@@ -44,9 +114,49 @@ class Storage:
                 self.db_path,
                 check_same_thread=False
             )
-            self._local.conn.row_factory = sqlite3.Row
+            self._local.conn.row_factory = _dict_factory
+            
+            # WAL lets worker polls read while another process writes, and
+            # synchronous=NORMAL avoids an fsync on every commit in WAL mode.
+            self._local.conn.executescript("""
+                PRAGMA journal_mode=WAL;
+                PRAGMA synchronous=NORMAL;
+                PRAGMA busy_timeout=5000;
+                PRAGMA temp_store=MEMORY;
+                PRAGMA mmap_size=268435456;
+            """)
+            with self._connections_lock:
+                self._connections.append(self._local.conn)
         return self._local.conn
     
+    def connect(self) -> "Storage":
+        """
+        Open this thread's connection now rather than on first query.
+        
+        Long-lived users (workers) call this once at startup and close()
+        on shutdown; the connection is reused for every query in between.
+        
+        Returns:
+            This storage instance
+        """
+        self._get_connection()
+        return self
+    
+    def close(self) -> None:
+        """Close every connection opened by this instance and its wake socket."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+        self.close_wake_socket()
+    
+    def __enter__(self) -> "Storage":
+        return self.connect()
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+    
     @contextmanager
     def _get_cursor(self):
         """
@@ -60,6 +170,10 @@ class Storage:
         try:
             yield cursor
             conn.commit()
+        except sqlite3.IntegrityError:
+            # Constraint violations (e.g. duplicate IDs) are reported by callers
+            conn.rollback()
+            raise
         except Exception as e:
             conn.rollback()
             logger.error(f"Database error: {e}")
@@ -67,6 +181,23 @@ class Storage:
         finally:
             cursor.close()
     
+    @contextmanager
+    def _read_cursor(self):
+        """
+        Context manager for a read-only cursor.
+        
+        Unlike _get_cursor, nothing is committed, so the cursor can stay
+        open across generator yields while results are streamed.
+        
+        Yields:
+            SQLite cursor
+        """
+        cursor = self._get_connection().cursor()
+        try:
+            yield cursor
+        finally:
+            cursor.close()
+    
     def _init_db(self) -> None:
         """Initialize database schema."""
         with self._get_cursor() as cursor:
@@ -81,20 +212,56 @@ class Storage:
                     updated_at TEXT NOT NULL,
                     scheduled_at TEXT,
                     error_message TEXT,
-                    lock_id TEXT
+                    lock_id TEXT,
+                    last_delay REAL,
+                    argv TEXT
                 )
             """)
             
+            # Upgrade databases created by older versions
+            cursor.execute("PRAGMA table_info(jobs)")
+            columns = {row['name'] for row in cursor.fetchall()}
+            for column, column_type in _ADDED_COLUMNS.items():
+                if column not in columns:
+                    cursor.execute(
+                        f"ALTER TABLE jobs ADD COLUMN {column} {column_type}"
+                    )
+            
+            # Covers the ready-job poll and state listings: state equality,
+            # then rows already in created_at order (so no sort step), with
+            # scheduled_at checked from the index. Also serves plain state
+            # filters, which made the old single-column idx_state redundant.
             cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_state 
-                ON jobs(state)
+                CREATE INDEX IF NOT EXISTS idx_state_created
+                ON jobs(state, created_at, scheduled_at)
             """)
             
+            # Superseded indexes from older versions
+            cursor.execute("DROP INDEX IF EXISTS idx_state")
+            cursor.execute("DROP INDEX IF EXISTS idx_ready")
+            
             cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_scheduled_at 
                 ON jobs(scheduled_at)
             """)
     
+    @staticmethod
+    def _job_row(job: Dict) -> tuple:
+        """Build the INSERT parameter tuple for a job dictionary."""
+        return (
+            job['id'],
+            job['command'],
+            job['state'],
+            job.get('attempts', 0),
+            job.get('max_retries', 3),
+            job['created_at'],
+            job['updated_at'],
+            job.get('scheduled_at'),
+            job.get('error_message'),
+            job.get('lock_id'),
+            job.get('argv')
+        )
+    
     def create_job(self, job: Dict) -> None:
         """
         Create a new job in the database.
@@ -103,23 +270,24 @@ class Storage:
             job: Job dictionary with all required fields
         """
         with self._get_cursor() as cursor:
-            cursor.execute("""
-                INSERT INTO jobs 
-                (id, command, state, attempts, max_retries, 
-                 created_at, updated_at, scheduled_at, error_message, lock_id)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                job['id'],
-                job['command'],
-                job['state'],
-                job.get('attempts', 0),
-                job.get('max_retries', 3),
-                job['created_at'],
-                job['updated_at'],
-                job.get('scheduled_at'),
-                job.get('error_message'),
-                job.get('lock_id')
-            ))
+            cursor.execute(self._INSERT_JOB_SQL, self._job_row(job))
+    
+    def create_jobs(self, jobs: List[Dict]) -> None:
+        """
+        Create multiple jobs in a single transaction.
+        
+        Args:
+            jobs: List of job dictionaries with all required fields
+            
+        Raises:
+            sqlite3.IntegrityError: If any job ID already exists (nothing is
+                inserted in that case)
+        """
+        with self._get_cursor() as cursor:
+            cursor.executemany(
+                self._INSERT_JOB_SQL,
+                [self._job_row(job) for job in jobs]
+            )
     
     def get_job(self, job_id: str) -> Optional[Dict]:
         """
@@ -133,8 +301,7 @@ class Storage:
         """
         with self._get_cursor() as cursor:
             cursor.execute("SELECT * FROM jobs WHERE id = ?", (job_id,))
-            row = cursor.fetchone()
-            return dict(row) if row else None
+            return cursor.fetchone()
     
     def update_job(self, job_id: str, updates: Dict) -> None:
         """
@@ -143,46 +310,179 @@ class Storage:
         Args:
             job_id: Job identifier
             updates: Dictionary of fields to update
+            
+        Raises:
+            ValueError: If updates contains a field that cannot be updated
         """
-        updates['updated_at'] = get_timestamp()
+        key = frozenset(updates)
+        template = _UPDATE_TEMPLATES.get(key)
+        if template is None:
+            invalid = key - _UPDATABLE_FIELDS
+            if invalid:
+                raise ValueError(
+                    f"Cannot update job fields: {', '.join(sorted(invalid))}"
+                )
+            columns = tuple(sorted(key))
+            set_clause = ", ".join(f"{column} = ?" for column in columns)
+            template = (
+                columns,
+                f"UPDATE jobs SET {set_clause}, updated_at = ? WHERE id = ?"
+            )
+            _UPDATE_TEMPLATES[key] = template
         
-        set_clause = ", ".join(f"{key} = ?" for key in updates.keys())
-        values = list(updates.values()) + [job_id]
+        columns, sql = template
+        values = [updates[column] for column in columns]
+        values.append(get_timestamp())
+        values.append(job_id)
         
         with self._get_cursor() as cursor:
-            cursor.execute(
-                f"UPDATE jobs SET {set_clause} WHERE id = ?",
-                values
-            )
+            cursor.execute(sql, values)
     
-    def list_jobs(self, state: Optional[str] = None) -> List[Dict]:
+    @staticmethod
+    def _select_jobs_sql(
+        columns: str,
+        state: Optional[str],
+        limit: Optional[int],
+        offset: int
+    ) -> Tuple[str, list]:
+        """
+        Pick the precomputed listing query and build its parameters.
+        
+        Returns:
+            Tuple of (SQL, parameters)
+        """
+        paged = limit is not None or bool(offset)
+        sql = _LIST_SQL[(columns, bool(state), paged)]
+        params: list = [state] if state else []
+        if paged:
+            # SQLite treats a negative LIMIT as "no limit"
+            params.extend([-1 if limit is None else limit, offset])
+        return sql, params
+    
+    def list_jobs(
+        self,
+        state: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[Dict]:
         """
         List jobs, optionally filtered by state.
         
         Args:
             state: Filter by job state (optional)
+            limit: Maximum number of jobs to return (optional)
+            offset: Number of jobs to skip
             
         Returns:
             List of job dictionaries
         """
+        sql, params = self._select_jobs_sql(_JOB_COLUMNS, state, limit, offset)
+        
         with self._get_cursor() as cursor:
-            if state:
-                cursor.execute(
-                    "SELECT * FROM jobs WHERE state = ? ORDER BY created_at",
-                    (state,)
-                )
-            else:
-                cursor.execute("SELECT * FROM jobs ORDER BY created_at")
+            cursor.execute(sql, params)
+            return cursor.fetchall()
+    
+    def _iter_rows(
+        self,
+        columns: str,
+        state: Optional[str],
+        limit: Optional[int],
+        offset: int,
+        chunk: int,
+        raw: bool = False
+    ) -> Iterator:
+        """
+        Stream listing query results, fetching chunk rows at a time.
+        
+        Args:
+            raw: Yield plain tuples instead of dicts
+        """
+        sql, params = self._select_jobs_sql(columns, state, limit, offset)
+        
+        with self._read_cursor() as cursor:
+            if raw:
+                cursor.row_factory = None
+            cursor.execute(sql, params)
+            while True:
+                rows = cursor.fetchmany(chunk)
+                if not rows:
+                    break
+                yield from rows
+    
+    def iter_jobs(
+        self,
+        state: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        chunk: int = 1000
+    ) -> Iterator[Dict]:
+        """
+        Iterate over jobs without loading the whole result set.
+        
+        Args:
+            state: Filter by job state (optional)
+            limit: Maximum number of jobs to return (optional)
+            offset: Number of jobs to skip
+            chunk: Number of rows fetched from SQLite at a time
+            
+        Returns:
+            Iterator of job dictionaries ordered by creation time
+        """
+        return self._iter_rows(_JOB_COLUMNS, state, limit, offset, chunk)
+    
+    def iter_jobs_brief(
+        self,
+        state: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        chunk: int = 1000
+    ) -> Iterator[Tuple[str, str, int, str]]:
+        """
+        Iterate over jobs as lightweight tuples for display.
+        
+        Rows are yielded straight from SQLite without building dicts.
+        
+        Args:
+            state: Filter by job state (optional)
+            limit: Maximum number of jobs to return (optional)
+            offset: Number of jobs to skip
+            chunk: Number of rows fetched from SQLite at a time
             
-            return [dict(row) for row in cursor.fetchall()]
+        Returns:
+            Iterator of (id, state, attempts, command) tuples ordered by
+            creation time
+        """
+        return self._iter_rows(
+            _BRIEF_COLUMNS, state, limit, offset, chunk, raw=True
+        )
+    
+    def count_by_state(self) -> Dict[str, int]:
+        """
+        Count jobs grouped by state.
+        
+        Returns:
+            Dictionary mapping state to job count (states with no jobs omitted)
+        """
+        with self._get_cursor() as cursor:
+            cursor.execute(
+                "SELECT state, COUNT(*) AS n FROM jobs GROUP BY state"
+            )
+            return {row['state']: row['n'] for row in cursor.fetchall()}
     
-    def acquire_job_lock(self, job_id: str, lock_id: str) -> bool:
+    def acquire_job_lock(
+        self,
+        job_id: str,
+        lock_id: str,
+        now: Optional[str] = None
+    ) -> bool:
         """
         Attempt to acquire a lock on a job.
         
         Args:
             job_id: Job identifier
             lock_id: Unique lock identifier
+            now: Timestamp to record (computed if None); pass one in when
+                locking several jobs in a row
             
         Returns:
             True if lock acquired, False otherwise
@@ -193,7 +493,7 @@ class Storage:
                 SET lock_id = ?, state = 'processing', updated_at = ?
                 WHERE id = ? AND (lock_id IS NULL OR lock_id = '')
                   AND state = 'pending'
-            """, (lock_id, get_timestamp(), job_id))
+            """, (lock_id, now or get_timestamp(), job_id))
             
             return cursor.rowcount > 0
     
@@ -233,7 +533,157 @@ class Storage:
                 LIMIT ?
             """, (current_time, limit))
             
-            return [dict(row) for row in cursor.fetchall()]
+            return cursor.fetchall()
+    
+    def claim_jobs(self, lock_id: str, limit: int = 1) -> List[Dict]:
+        """
+        Atomically lock and return ready jobs in a single statement.
+        
+        Jobs are moved to 'processing' and tagged with lock_id, so concurrent
+        workers can never claim the same job.
+        
+        Args:
+            lock_id: Unique lock identifier (the worker ID)
+            limit: Maximum number of jobs to claim
+            
+        Returns:
+            List of claimed job dictionaries, oldest first
+        """
+        now = get_timestamp()
+        
+        if sqlite3.sqlite_version_info < (3, 35, 0):
+            # No RETURNING support: fall back to select-then-lock
+            claimed = []
+            for job in self.get_ready_jobs(limit):
+                if self.acquire_job_lock(job['id'], lock_id, now):
+                    claimed.append(self.get_job(job['id']))
+            return claimed
+        
+        with self._get_cursor() as cursor:
+            cursor.execute("""
+                UPDATE jobs
+                SET state = 'processing', lock_id = ?, updated_at = ?
+                WHERE id IN (
+                    SELECT id FROM jobs
+                    WHERE state = 'pending'
+                      AND (scheduled_at IS NULL OR scheduled_at <= ?)
+                    ORDER BY created_at
+                    LIMIT ?
+                )
+                RETURNING *
+            """, (lock_id, now, now, limit))
+            
+            jobs = cursor.fetchall()
+        
+        # RETURNING does not guarantee row order
+        jobs.sort(key=lambda job: job['created_at'])
+        return jobs
+    
+    def claim_next_job(self, lock_id: str) -> Optional[Dict]:
+        """
+        Atomically lock and return the oldest ready job.
+        
+        Single-job form of claim_jobs: the full job record comes back from
+        the same statement that locks it.
+        
+        Args:
+            lock_id: Unique lock identifier (the worker ID)
+            
+        Returns:
+            Claimed job dictionary or None if no job is ready
+        """
+        if sqlite3.sqlite_version_info < (3, 35, 0):
+            claimed = self.claim_jobs(lock_id, limit=1)
+            return claimed[0] if claimed else None
+        
+        now = get_timestamp()
+        
+        with self._get_cursor() as cursor:
+            cursor.execute("""
+                UPDATE jobs
+                SET state = 'processing', lock_id = ?, updated_at = ?
+                WHERE id = (
+                    SELECT id FROM jobs
+                    WHERE state = 'pending'
+                      AND (scheduled_at IS NULL OR scheduled_at <= ?)
+                    ORDER BY created_at
+                    LIMIT 1
+                )
+                RETURNING *
+            """, (lock_id, now, now))
+            
+            return cursor.fetchone()
+    
+    def mark_completed_many(self, job_ids: List[str], lock_id: str) -> None:
+        """
+        Mark jobs completed and release their locks in one transaction.
+        
+        Args:
+            job_ids: Job identifiers
+            lock_id: Lock identifier to verify ownership
+        """
+        now = get_timestamp()
+        
+        with self._get_cursor() as cursor:
+            cursor.executemany("""
+                UPDATE jobs
+                SET state = 'completed', error_message = NULL,
+                    lock_id = NULL, updated_at = ?
+                WHERE id = ? AND lock_id = ?
+            """, [(now, job_id, lock_id) for job_id in job_ids])
+    
+    def mark_failed_many(
+        self,
+        failures: List[Tuple[str, Dict]],
+        lock_id: str
+    ) -> None:
+        """
+        Record failed jobs and release their locks in one transaction.
+        
+        Args:
+            failures: (job_id, updates) pairs; each updates dict holds state,
+                attempts, error_message, scheduled_at and last_delay
+            lock_id: Lock identifier to verify ownership
+        """
+        now = get_timestamp()
+        
+        with self._get_cursor() as cursor:
+            cursor.executemany("""
+                UPDATE jobs
+                SET state = ?, attempts = ?, error_message = ?,
+                    scheduled_at = ?, last_delay = ?,
+                    lock_id = NULL, updated_at = ?
+                WHERE id = ? AND lock_id = ?
+            """, [
+                (
+                    updates['state'],
+                    updates['attempts'],
+                    updates['error_message'],
+                    updates['scheduled_at'],
+                    updates['last_delay'],
+                    now,
+                    job_id,
+                    lock_id
+                )
+                for job_id, updates in failures
+            ])
+    
+    def unclaim_jobs(self, job_ids: List[str], lock_id: str) -> None:
+        """
+        Return claimed but unstarted jobs to the pending state.
+        
+        Args:
+            job_ids: Identifiers of jobs to release
+            lock_id: Lock identifier to verify ownership
+        """
+        now = get_timestamp()
+        
+        with self._get_cursor() as cursor:
+            cursor.executemany("""
+                UPDATE jobs
+                SET state = 'pending', lock_id = NULL, updated_at = ?
+                WHERE id = ? AND lock_id = ? AND state = 'processing'
+            """, [(now, job_id, lock_id) for job_id in job_ids])
     
     def delete_job(self, job_id: str) -> None:
         """
@@ -244,3 +694,157 @@ class Storage:
         """
         with self._get_cursor() as cursor:
             cursor.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+    
+    def notify_job_ready(self) -> None:
+        """
+        Wake every process blocked in wait_for_job.
+        
+        Sends a datagram to each waiter socket in the wake directory and
+        removes sockets left behind by processes that no longer exist.
+        """
+        if not hasattr(socket, "AF_UNIX"):
+            return
+        
+        try:
+            paths = list(self._wake_dir.glob("*.sock"))
+        except OSError:
+            return
+        if not paths:
+            return
+        
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
+            sock.setblocking(False)
+            for path in paths:
+                try:
+                    sock.sendto(b"1", str(path))
+                except BlockingIOError:
+                    pass  # waiter's buffer is full: it is already awake
+                except (ConnectionRefusedError, FileNotFoundError):
+                    path.unlink(missing_ok=True)
+                except OSError as e:
+                    logger.warning(f"Failed to notify waiter {path}: {e}")
+    
+    def wait_for_job(self, timeout: float) -> bool:
+        """
+        Block until a job may be ready or the timeout expires.
+        
+        Wake-ups are edge-triggered hints: callers must still query for
+        ready jobs afterwards. Falls back to sleeping where Unix sockets
+        are unavailable or the waiter socket cannot be bound.
+        
+        Args:
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            True if woken by a notification, False on timeout
+        """
+        sock = self._wake_socket_or_none()
+        if sock is None:
+            time.sleep(timeout)
+            return False
+        
+        readable, _, _ = select.select([sock], [], [], timeout)
+        if not readable:
+            return False
+        
+        self._drain_wake_socket()
+        return True
+    
+    async def wait_for_job_async(self, timeout: float) -> bool:
+        """
+        Event-loop friendly variant of wait_for_job.
+        
+        Args:
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            True if woken by a notification, False on timeout
+        """
+        sock = self._wake_socket_or_none()
+        if sock is None:
+            await asyncio.sleep(timeout)
+            return False
+        
+        loop = asyncio.get_running_loop()
+        fd = sock.fileno()
+        woken = loop.create_future()
+        loop.add_reader(fd, lambda: woken.done() or woken.set_result(None))
+        try:
+            await asyncio.wait_for(woken, timeout)
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            loop.remove_reader(fd)
+        
+        self._drain_wake_socket()
+        return True
+    
+    def _drain_wake_socket(self) -> None:
+        """Discard queued notifications so several count as one wake-up."""
+        try:
+            while self._wake_sock.recv(64):
+                pass
+        except BlockingIOError:
+            pass
+    
+    def _wake_socket_or_none(self) -> Optional[socket.socket]:
+        """
+        Get the waiter socket, or None if waits have to fall back to sleeping.
+        
+        Binding can fail (e.g. the socket path exceeds the AF_UNIX limit or
+        the wake directory is read-only); that is logged once and the socket
+        is not retried.
+        """
+        if self._wake_unavailable or not hasattr(socket, "AF_UNIX"):
+            return None
+        
+        try:
+            return self._get_wake_socket()
+        except OSError as e:
+            self._wake_unavailable = True
+            logger.warning(
+                f"Cannot create wake socket in {self._wake_dir}, "
+                f"polling instead: {e}"
+            )
+            return None
+    
+    def _get_wake_socket(self) -> socket.socket:
+        """
+        Get this instance's waiter socket, binding it on first use.
+        
+        Returns:
+            Non-blocking Unix datagram socket
+        """
+        if self._wake_sock is None:
+            self._wake_dir.mkdir(parents=True, exist_ok=True)
+            path = self._wake_dir / f"{os.getpid()}-{id(self):x}.sock"
+            path.unlink(missing_ok=True)
+            
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+            try:
+                sock.bind(str(path))
+            except OSError:
+                sock.close()
+                raise
+            sock.setblocking(False)
+            self._wake_sock, self._wake_path = sock, path
+        return self._wake_sock
+    
+    def interrupt_wait(self) -> None:
+        """Make a pending or upcoming wait_for_job call return immediately."""
+        if self._wake_path is None:
+            return
+        
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
+            sock.setblocking(False)
+            try:
+                sock.sendto(b"1", str(self._wake_path))
+            except OSError:
+                pass
+    
+    def close_wake_socket(self) -> None:
+        """Stop receiving job notifications and remove the waiter socket."""
+        if self._wake_sock is not None:
+            self._wake_sock.close()
+            self._wake_path.unlink(missing_ok=True)
+            self._wake_sock = self._wake_path = None
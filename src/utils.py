@@ -1,17 +1,25 @@
 """Utility functions for QueueCTL."""
 
 import logging
+import logging.handlers
+import random
+import shlex
 import sys
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import List, Optional
 
+_utc = timezone.utc
 
-def setup_logging(level: int = logging.INFO) -> logging.Logger:
+
+def setup_logging(level: int = logging.INFO, log_queue=None) -> logging.Logger:
     """
     Configure and return a logger for the application.
     
     Args:
         level: Logging level (default: INFO)
+        log_queue: Queue to hand records to instead of writing them here;
+            a QueueListener in another process does the writing
         
     Returns:
         Configured logger instance
@@ -19,7 +27,9 @@ def setup_logging(level: int = logging.INFO) -> logging.Logger:
     logger = logging.getLogger("queuectl")
     logger.setLevel(level)
     
-    if not logger.handlers:
+    if log_queue is not None:
+        logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+    elif not logger.handlers:
         handler = logging.StreamHandler(sys.stdout)
         handler.setLevel(level)
         formatter = logging.Formatter(
@@ -33,12 +43,15 @@ def setup_logging(level: int = logging.INFO) -> logging.Logger:
 
 def get_timestamp() -> str:
     """
-    Get current timestamp in ISO format.
+    Get current UTC timestamp in ISO format.
+    
+    Always includes microseconds so timestamps have a fixed width and
+    compare correctly as strings in SQL.
     
     Returns:
         ISO formatted timestamp string
     """
-    return datetime.utcnow().isoformat()
+    return datetime.now(_utc).isoformat(timespec='microseconds')
 
 
 def parse_timestamp(timestamp: str) -> datetime:
@@ -54,18 +67,105 @@ def parse_timestamp(timestamp: str) -> datetime:
     return datetime.fromisoformat(timestamp)
 
 
-def calculate_backoff_delay(attempts: int, base: float = 2.0) -> float:
+@lru_cache(maxsize=128)
+def _exponential_delay(attempts: int, base: float) -> float:
+    """Memoized base ** attempts; only a handful of pairs ever occur."""
+    return base ** attempts
+
+
+def calculate_backoff_delay(
+    attempts: int,
+    base: float = 2.0,
+    cap: float = 300.0,
+    prev: Optional[float] = None
+) -> float:
     """
-    Calculate exponential backoff delay.
+    Calculate exponential backoff delay with decorrelated jitter.
+    
+    Jitter spreads out retries of jobs that failed together, so they do
+    not all become ready at the same instant.
     
     Args:
         attempts: Number of retry attempts
         base: Base for exponential calculation
+        cap: Maximum delay in seconds
+        prev: Previous delay used for this job, if any
         
     Returns:
         Delay in seconds
     """
-    return base ** attempts
+    # Without a previous delay (first retry, or a job from an older
+    # version), seed from the exponential delay; on the first retry that is
+    # base itself, so the first retries already spread over [base, 3*base]
+    seed = prev or max(base, _exponential_delay(attempts, base))
+    return min(cap, random.uniform(base, seed * 3))
+
+
+# Characters that only mean something to a shell (pipes, redirection,
+# globbing, expansion, grouping, comments)
+_SHELL_CHARS = frozenset("|&;<>()$`\\*?[]{}~#!\n")
+
+# Commands that only exist as shell builtins
+_SHELL_BUILTINS = frozenset({
+    ".", ":", "alias", "bg", "cd", "command", "eval", "exec", "exit",
+    "export", "fg", "hash", "jobs", "local", "read", "readonly", "return",
+    "set", "shift", "source", "trap", "type", "ulimit", "umask", "unset",
+    "wait",
+})
+
+
+def needs_shell(command: str) -> bool:
+    """
+    Check whether a command needs /bin/sh to run.
+    
+    Args:
+        command: Command string as enqueued
+        
+    Returns:
+        True if the command uses shell syntax or builtins
+    """
+    if any(char in _SHELL_CHARS for char in command):
+        return True
+    
+    try:
+        argv = shlex.split(command)
+    except ValueError:
+        return True  # unbalanced quotes: let the shell report it
+    
+    # Leading VAR=value assignments are shell syntax too
+    return not argv or argv[0] in _SHELL_BUILTINS or "=" in argv[0]
+
+
+def command_argv(command: str) -> Optional[List[str]]:
+    """
+    Split a command into argv for direct execution.
+    
+    Args:
+        command: Command string as enqueued
+        
+    Returns:
+        Argument list, or None if the command must run through the shell
+    """
+    if needs_shell(command):
+        return None
+    return shlex.split(command)
+
+
+class _LazyLogger:
+    """
+    Proxy for the application logger that defers handler setup.
+
+    Handlers and formatters are only attached on first use, so importing
+    this module (e.g. for `queuectl --help`) stays cheap.
+    """
+
+    def __init__(self):
+        self._logger: Optional[logging.Logger] = None
+
+    def __getattr__(self, name: str):
+        if self._logger is None:
+            self._logger = setup_logging()
+        return getattr(self._logger, name)
 
 
-logger = setup_logging()
+logger = _LazyLogger()
@@ -1,13 +1,22 @@
 """Worker process implementation."""
 
+import asyncio
+import errno
+import json
+import logging
 import multiprocessing
 import os
+import select
 import signal
-import subprocess
+import sys
+import threading
 import time
 import uuid
+from collections import deque
+from functools import lru_cache
+from logging.handlers import QueueListener
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Set, Tuple, Union
 
 from .config import Config
 from .job_manager import JobManager
@@ -15,6 +24,66 @@ from .storage import Storage
 from .utils import logger, setup_logging
 
 
+@lru_cache(maxsize=1)
+def _can_posix_spawn() -> bool:
+    """
+    Check whether jobs can be started with posix_spawn and awaited via pidfd.
+
+    Returns:
+        True if os.posix_spawn and a working os.pidfd_open are available
+    """
+    if not (hasattr(os, "posix_spawn") and hasattr(os, "pidfd_open")):
+        return False
+    try:
+        os.close(os.pidfd_open(os.getpid()))
+    except OSError:
+        return False  # kernel older than 5.3
+    return True
+
+
+# Set once _make_inherited_fds_non_inheritable has covered every fd in
+# this process, so children no longer need close_fds to close them
+_inherited_fds_closed = False
+
+
+def _make_inherited_fds_non_inheritable() -> None:
+    """
+    Mark every fd above stderr close-on-exec.
+
+    A worker process starts with inheritable pipes from multiprocessing
+    (fork server, resource tracker, log queue). posix_spawn never closes
+    fds, so without this every job would hold them open. Python and SQLite
+    open their own fds close-on-exec, so one pass at startup is enough.
+    """
+    global _inherited_fds_closed
+
+    for fd_dir in ("/proc/self/fd", "/dev/fd"):
+        try:
+            fds = [int(name) for name in os.listdir(fd_dir)]
+            break
+        except OSError:
+            continue
+    else:
+        return
+
+    for fd in fds:
+        if fd > 2:
+            try:
+                os.set_inheritable(fd, False)
+            except OSError as e:
+                # EBADF is the directory fd used for the listing; anything
+                # else leaves an fd we could not cover
+                if e.errno != errno.EBADF:
+                    return
+
+    _inherited_fds_closed = True
+
+
+# exec() errors the shell handles itself: a missing command (which it
+# reports in the log) and a script without a shebang (which it runs)
+_SHELL_FALLBACK_ERRNOS = frozenset({errno.ENOENT, errno.ENOEXEC})
+
+
 class Worker:
     """
     Worker process that executes jobs from the queue.
@@ -24,7 +93,8 @@ class Worker:
         self,
         worker_id: str,
         storage: Optional[Storage] = None,
-        config: Optional[Config] = None
+        config: Optional[Config] = None,
+        concurrency: Optional[int] = None
     ):
         """
         Initialize worker.
@@ -33,125 +103,542 @@ class Worker:
             worker_id: Unique worker identifier
             storage: Storage instance
             config: Config instance
+            concurrency: Jobs to run at once (default: worker_concurrency)
         """
         self.worker_id = worker_id
-        self.storage = storage or Storage()
+        self.storage = (storage or Storage()).connect()
         self.config = config or Config()
         self.job_manager = JobManager(self.storage, self.config)
         self.should_stop = False
-        self.current_job_id = None
 
-        # Setup signal handlers for graceful shutdown
-        signal.signal(signal.SIGTERM, self._signal_handler)
-        signal.signal(signal.SIGINT, self._signal_handler)
+        # Jobs currently executing (several when worker_concurrency > 1)
+        self._active_jobs: Set[str] = set()
+        if concurrency is None:
+            concurrency = self.config.get("worker_concurrency", 1)
+        self._concurrency = max(1, int(concurrency))
+
+        # Jobs claimed ahead of time so one storage call can feed several runs
+        self._local_queue: deque = deque()
+        self._local_queue_size = max(1, int(self.config.get("local_queue_size", 1)))
+
+        # Optional batching of completion/failure writes (0 = write immediately)
+        self._batch_delay = self.config.get("complete_batch_delay_ms", 0) / 1000
+        self._batch_max = max(1, int(self.config.get("complete_batch_max", 100)))
+        self._pending_complete: List[str] = []
+        self._pending_fail: List[Tuple[Dict, str]] = []
+        self._batch_cond = threading.Condition()
+        self._flusher: Optional[threading.Thread] = None
+        self._flusher_stop = False
+
+        # Per-job logs go here; created once rather than on every job
+        self._log_dir = Path.home() / ".queuectl" / "logs"
+        self._log_dir.mkdir(parents=True, exist_ok=True)
+        self._log_dir_str = str(self._log_dir)
+
+        # With log_retention "failed", logs start as unnamed O_TMPFILE files
+        # and are only linked into the log directory when the job fails
+        self._tmpfile_logs = (
+            self.config.get("log_retention", "all") == "failed"
+            and hasattr(os, "O_TMPFILE")
+        )
+
+        # Wall-clock limit per job, enforced on the event loop
+        self._job_timeout = float(self.config.get("job_timeout", 300.0))
+
+        # Upper bound on how long an idle worker waits before polling again
+        self._poll = float(self.config.get("worker_poll_interval", 1.0))
 
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals gracefully."""
         logger.info(f"Worker {self.worker_id} received shutdown signal")
         self.should_stop = True
+        self.storage.interrupt_wait()
+
+    async def _spawn(self, command: str, argv: Optional[str], log_fd: int):
+        """
+        Start a job's process, bypassing the shell when possible.
+
+        The job gets its own session so signals aimed at the worker process
+        group do not reach it. Once worker_process has made every fd
+        close-on-exec, the child skips the close-all-fds pass.
+
+        Args:
+            command: Command string as enqueued
+            argv: JSON argv precomputed at enqueue time, or None if the
+                command needs the shell
+            log_fd: File descriptor receiving stdout and stderr
+
+        Returns:
+            asyncio.subprocess.Process
+        """
+        close_fds = not _inherited_fds_closed
+
+        if argv is not None:
+            try:
+                return await asyncio.create_subprocess_exec(
+                    *json.loads(argv),
+                    stdout=log_fd,
+                    stderr=asyncio.subprocess.STDOUT,
+                    start_new_session=True,
+                    close_fds=close_fds
+                )
+            except OSError as e:
+                if e.errno not in _SHELL_FALLBACK_ERRNOS:
+                    raise
+
+        return await asyncio.create_subprocess_shell(
+            command,
+            stdout=log_fd,
+            stderr=asyncio.subprocess.STDOUT,
+            start_new_session=True,
+            close_fds=close_fds
+        )
+
+    async def _run_subprocess(
+        self,
+        command: str,
+        argv: Optional[str],
+        log: Union[str, int],
+        timeout: float
+    ) -> Optional[int]:
+        """
+        Run a job through asyncio's subprocess support.
+
+        Args:
+            command: Command string as enqueued
+            argv: JSON argv for direct execution (None to use the shell)
+            log: Path of the file receiving stdout and stderr, or an open
+                fd for it (left open for the caller)
+            timeout: Seconds before the process is killed
+
+        Returns:
+            Exit code, or None if the process timed out
+        """
+        if isinstance(log, int):
+            log_fd = log
+        else:
+            # A raw fd is all the child needs; no Python file object required
+            log_fd = os.open(
+                log,
+                os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0),
+                0o644
+            )
+        try:
+            proc = await self._spawn(command, argv, log_fd)
+            try:
+                return await asyncio.wait_for(proc.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                if hasattr(os, "killpg"):
+                    # start_new_session made the job a group leader, so this
+                    # also kills whatever a shell pipeline started
+                    try:
+                        os.killpg(proc.pid, signal.SIGKILL)
+                    except ProcessLookupError:
+                        pass  # the whole group already exited
+                else:
+                    proc.kill()
+                await proc.wait()
+                return None
+        finally:
+            if not isinstance(log, int):
+                os.close(log_fd)
+
+    async def _run_posix_spawn(
+        self,
+        command: str,
+        argv: Optional[str],
+        log: Union[str, int],
+        timeout: float
+    ) -> Optional[int]:
+        """
+        Run a job with os.posix_spawn, letting the child open its own log.
+
+        The log is opened onto the child's stdout by a spawn file action, so
+        no file object or fd plumbing happens in this process. Exit is
+        awaited through a pidfd registered with the event loop. The job
+        leads its own process group, outside the workers' group.
+
+        Args:
+            command: Command string as enqueued
+            argv: JSON argv for direct execution (None to use the shell)
+            log: Path of the file receiving stdout and stderr, or an open
+                fd to duplicate onto them
+            timeout: Seconds before the process is killed
+
+        Returns:
+            Exit code (negative signal number if killed by a signal), or
+            None if the process timed out
+        """
+        if isinstance(log, int):
+            open_log = (os.POSIX_SPAWN_DUP2, log, 1)
+        else:
+            open_log = (os.POSIX_SPAWN_OPEN, 1, log,
+                        os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        file_actions = [open_log, (os.POSIX_SPAWN_DUP2, 1, 2)]
+
+        pid = None
+        if argv is not None:
+            args = json.loads(argv)
+            try:
+                pid = os.posix_spawnp(
+                    args[0], args, os.environ,
+                    file_actions=file_actions, setpgroup=0
+                )
+            except OSError as e:
+                if e.errno not in _SHELL_FALLBACK_ERRNOS:
+                    raise
+        if pid is None:
+            pid = os.posix_spawn(
+                "/bin/sh", ["/bin/sh", "-c", command], os.environ,
+                file_actions=file_actions, setpgroup=0
+            )
+
+        pidfd = os.pidfd_open(pid)
+        loop = asyncio.get_running_loop()
+        exited = loop.create_future()
+        loop.add_reader(pidfd, lambda: exited.done() or exited.set_result(None))
+        timed_out = False
+        try:
+            try:
+                await asyncio.wait_for(asyncio.shield(exited), timeout=timeout)
+            except asyncio.TimeoutError:
+                timed_out = True
+                # The job leads its own process group and is not yet
+                # reaped, so its PID still names that group
+                os.killpg(pid, signal.SIGKILL)
+                await exited
+        finally:
+            loop.remove_reader(pidfd)
+            os.close(pidfd)
+
+        # The pidfd is readable only once the child has exited, so this
+        # reaps it without blocking
+        _, status = os.waitpid(pid, 0)
+        return None if timed_out else os.waitstatus_to_exitcode(status)
+
+    def _open_tmpfile_log(self) -> Optional[int]:
+        """
+        Open an unnamed log file in the log directory.
+
+        Returns:
+            File descriptor, or None if the filesystem lacks O_TMPFILE
+            support (tmpfile logs are then disabled for this worker)
+        """
+        try:
+            return os.open(
+                self._log_dir_str, os.O_TMPFILE | os.O_WRONLY | os.O_CLOEXEC, 0o644
+            )
+        except OSError as e:
+            logger.warning(
+                f"Worker {self.worker_id} cannot create O_TMPFILE logs ({e}); "
+                f"keeping all logs"
+            )
+            self._tmpfile_logs = False
+            return None
+
+    def _link_log(self, log_fd: int, job_id: str) -> None:
+        """Give an O_TMPFILE log its name, atomically replacing any earlier log."""
+        # link() cannot overwrite, so link under a unique temporary name and
+        # rename that over the final one; readers never see the log missing
+        tmp_name = f".{job_id}.log.{uuid.uuid4().hex[:8]}.tmp"
+
+        # os.link only uses linkat(AT_SYMLINK_FOLLOW), which resolves the
+        # /proc link to the open file, when given a directory fd
+        dir_fd = os.open(self._log_dir_str, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.link(f"/proc/self/fd/{log_fd}", tmp_name, dst_dir_fd=dir_fd)
+            try:
+                os.replace(
+                    tmp_name, f"{job_id}.log",
+                    src_dir_fd=dir_fd, dst_dir_fd=dir_fd
+                )
+            except OSError:
+                os.unlink(tmp_name, dir_fd=dir_fd)
+                raise
+        finally:
+            os.close(dir_fd)
 
-    def _execute_command(self, command: str, job_id: str) -> tuple[bool, str]:
+    async def _execute_command(
+        self,
+        command: str,
+        job_id: str,
+        argv: Optional[str] = None
+    ) -> tuple[bool, str]:
         """
-        Execute a shell command.
+        Execute a command without blocking the event loop.
 
         Args:
             command: Shell command to execute
             job_id: Current job ID (for logging)
+            argv: JSON argv for direct execution (None to use the shell)
 
         Returns:
             Tuple of (success, output/error message)
         """
         try:
             # Optional logging of stdout/stderr to file
-            log_dir = Path.home() / ".queuectl" / "logs"
-            log_dir.mkdir(parents=True, exist_ok=True)
-            log_path = log_dir / f"{job_id}.log"
-
-            with open(log_path, "w", encoding="utf-8") as log_file:
-                result = subprocess.run(
-                    command,
-                    shell=True,
-                    stdout=log_file,
-                    stderr=subprocess.STDOUT,
-                    text=True,
-                    timeout=300  # 5 minutes
-                )
+            log_path = f"{self._log_dir_str}/{job_id}.log"
+            log_fd = self._open_tmpfile_log() if self._tmpfile_logs else None
 
-            if result.returncode == 0:
+            run = self._run_posix_spawn if _can_posix_spawn() else self._run_subprocess
+            try:
+                returncode = await run(
+                    command, argv, log_path if log_fd is None else log_fd,
+                    self._job_timeout
+                )
+                if log_fd is not None and returncode != 0:
+                    self._link_log(log_fd, job_id)
+            finally:
+                if log_fd is not None:
+                    os.close(log_fd)
+
+            if returncode is None:
+                return False, f"Command timeout. See log at {log_path}"
+
+            if returncode == 0:
+                if log_fd is not None:
+                    return True, "Output discarded (log_retention=failed)"
                 return True, f"Output logged to {log_path}"
             else:
-                return False, f"Non-zero exit code {result.returncode}. See {log_path}"
+                return False, f"Non-zero exit code {returncode}. See {log_path}"
 
-        except subprocess.TimeoutExpired:
-            return False, f"Command timeout. See log at {log_path}"
         except Exception as e:
             return False, str(e)
 
-    def _process_job(self, job: dict) -> None:
+    async def _process_job(self, job: dict) -> None:
         """Process a single job."""
         job_id = job["id"]
-        self.current_job_id = job_id
+        self._active_jobs.add(job_id)
 
         logger.info(
             f"Worker {self.worker_id} processing job {job_id}: {job['command']}"
         )
 
         # Execute the command
-        success, output = self._execute_command(job["command"], job_id)
+        success, output = await self._execute_command(
+            job["command"], job_id, job.get("argv")
+        )
 
         if success:
-            self.job_manager.mark_completed(job_id)
             logger.info(f"Worker {self.worker_id} completed job {job_id}")
         else:
             error_msg = f"Command failed: {output}"
-            self.job_manager.mark_failed(job_id, error_msg)
             logger.error(
                 f"Worker {self.worker_id} failed job {job_id}: {error_msg}"
             )
 
-        # Release lock
-        self.storage.release_job_lock(job_id, self.worker_id)
-        self.current_job_id = None
+        if self._flusher is not None:
+            # The flusher thread records the result and releases the lock
+            with self._batch_cond:
+                if success:
+                    self._pending_complete.append(job_id)
+                else:
+                    self._pending_fail.append((job, error_msg))
+                self._batch_cond.notify()
+        else:
+            if success:
+                self.job_manager.mark_completed(job_id)
+            else:
+                self.job_manager.mark_failed(job_id, error_msg)
 
-    def run(self) -> None:
-        """Main worker loop."""
-        logger.info(f"Worker {self.worker_id} started")
-        poll_interval = self.config.get("worker_poll_interval")
+            # Release lock
+            self.storage.release_job_lock(job_id, self.worker_id)
+
+        self._active_jobs.discard(job_id)
+
+    async def _run_job(self, job: dict, slots: asyncio.Semaphore) -> None:
+        """Run one job as a task, freeing its concurrency slot when done."""
+        try:
+            await self._process_job(job)
+        except Exception as e:
+            logger.error(f"Worker {self.worker_id} error: {e}")
+        finally:
+            slots.release()
+
+    def _flush_loop(self) -> None:
+        """
+        Background thread that writes job results in batches.
+
+        A batch is flushed complete_batch_delay_ms after its first result
+        arrives, or as soon as it reaches complete_batch_max results.
+        """
+        while True:
+            with self._batch_cond:
+                while not self._has_pending_results() and not self._flusher_stop:
+                    self._batch_cond.wait()
+                if not self._has_pending_results():
+                    break
+
+                deadline = time.monotonic() + self._batch_delay
+                while (
+                    len(self._pending_complete) + len(self._pending_fail) < self._batch_max
+                    and not self._flusher_stop
+                ):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._batch_cond.wait(remaining)
+
+                completed, self._pending_complete = self._pending_complete, []
+                failed, self._pending_fail = self._pending_fail, []
 
-        while not self.should_stop:
             try:
-                ready_jobs = self.storage.get_ready_jobs(limit=1)
-                logger.info(f"Worker {self.worker_id} found {len(ready_jobs)} ready jobs")
+                if completed:
+                    self.job_manager.mark_completed_many(completed, self.worker_id)
+                if failed:
+                    self.job_manager.mark_failed_many(failed, self.worker_id)
+            except Exception as e:
+                logger.error(f"Worker {self.worker_id} failed to flush results: {e}")
 
-                if not ready_jobs:
-                    time.sleep(poll_interval)
-                    continue
+    def _has_pending_results(self) -> bool:
+        """Check for buffered results (caller holds _batch_cond)."""
+        return bool(self._pending_complete or self._pending_fail)
 
-                job = ready_jobs[0]
-                if self.storage.acquire_job_lock(job["id"], self.worker_id):
-                    job = self.storage.get_job(job["id"])
-                    self._process_job(job)
-                else:
-                    time.sleep(poll_interval)
+    def _start_flusher(self) -> None:
+        """Start the result flusher thread if batching is enabled."""
+        if self._batch_delay <= 0:
+            return
+        self._flusher_stop = False
+        self._flusher = threading.Thread(
+            target=self._flush_loop,
+            name=f"{self.worker_id}-flusher",
+            daemon=True
+        )
+        self._flusher.start()
 
+    def _stop_flusher(self) -> None:
+        """Flush any buffered results and stop the flusher thread."""
+        if self._flusher is None:
+            return
+        with self._batch_cond:
+            self._flusher_stop = True
+            self._batch_cond.notify()
+        self._flusher.join()
+        self._flusher = None
+
+    async def run(self) -> None:
+        """Run the worker loop, closing the storage connection on exit."""
+        try:
+            await self._run_loop()
+        finally:
+            self.storage.close()
+
+    async def _run_loop(self) -> None:
+        """
+        Main worker loop.
+
+        Claims jobs and runs up to worker_concurrency of them at once as
+        asyncio tasks; each job's command runs as a child process.
+        """
+        logger.info(f"Worker {self.worker_id} started")
+        poll_interval = self._poll
+        self._start_flusher()
+
+        slots = asyncio.Semaphore(self._concurrency)
+        tasks: Set[asyncio.Task] = set()
+
+        while not self.should_stop:
+            # Only look for work once a slot is free to run it
+            await slots.acquire()
+            if self.should_stop:
+                slots.release()
+                break
+
+            try:
+                if not self._local_queue:
+                    if self._local_queue_size == 1:
+                        job = self.storage.claim_next_job(self.worker_id)
+                        claimed = [job] if job else []
+                    else:
+                        claimed = self.storage.claim_jobs(
+                            self.worker_id, limit=self._local_queue_size
+                        )
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Worker {self.worker_id} claimed {len(claimed)} ready jobs")
+                    self._local_queue.extend(claimed)
+
+                job = self._local_queue.popleft() if self._local_queue else None
             except Exception as e:
+                slots.release()
                 logger.error(f"Worker {self.worker_id} error: {e}")
-                time.sleep(poll_interval)
+                await asyncio.sleep(poll_interval)
+                continue
 
-        if self.current_job_id:
+            if job is None:
+                slots.release()
+                try:
+                    # Enqueue wakes us early; poll_interval only bounds the
+                    # wait so retries scheduled for later are picked up
+                    await self.storage.wait_for_job_async(timeout=poll_interval)
+                except Exception as e:
+                    # The slot is already released, so only back off here
+                    logger.error(f"Worker {self.worker_id} error: {e}")
+                    await asyncio.sleep(poll_interval)
+                continue
+
+            task = asyncio.create_task(self._run_job(job, slots))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+        # Let in-flight jobs finish before shutting down
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        for job_id in list(self._active_jobs):
+            logger.info(
+                f"Worker {self.worker_id} releasing lock on job {job_id}"
+            )
+            self.storage.release_job_lock(job_id, self.worker_id)
+        self._active_jobs.clear()
+
+        self._stop_flusher()
+
+        if self._local_queue:
+            # Hand back claimed jobs that never started
+            job_ids = [job["id"] for job in self._local_queue]
             logger.info(
-                f"Worker {self.worker_id} releasing lock on job {self.current_job_id}"
+                f"Worker {self.worker_id} returning {len(job_ids)} unstarted jobs"
             )
-            self.storage.release_job_lock(self.current_job_id, self.worker_id)
+            self.storage.unclaim_jobs(job_ids, self.worker_id)
+            self._local_queue.clear()
 
         logger.info(f"Worker {self.worker_id} stopped")
 
 
-def worker_process(worker_id: str):
-    """Entry point for worker process."""
-    setup_logging()
-    worker = Worker(worker_id)
-    worker.run()
+def worker_process(
+    worker_id: str,
+    concurrency: Optional[int] = None,
+    pgid: Optional[int] = None,
+    group_ready=None,
+    log_queue=None
+):
+    """
+    Entry point for worker process.
+
+    Args:
+        worker_id: Unique worker identifier
+        concurrency: Jobs to run at once as tasks on this process's event
+            loop, sharing one Storage (default: worker_concurrency)
+        pgid: Process group to join, or None to lead a new one
+        group_ready: Event set once the process group has been joined
+        log_queue: Queue that log records are sent through to the manager
+    """
+    _make_inherited_fds_non_inheritable()
+
+    if hasattr(os, "setpgid"):
+        os.setpgid(0, pgid or 0)
+    if group_ready is not None:
+        group_ready.set()
+
+    setup_logging(log_queue=log_queue)
+    worker = Worker(worker_id, concurrency=concurrency)
+
+    # Setup signal handlers for graceful shutdown (here rather than in
+    # Worker so that constructing a Worker never replaces a caller's handlers)
+    signal.signal(signal.SIGTERM, worker._signal_handler)
+    signal.signal(signal.SIGINT, worker._signal_handler)
+
+    asyncio.run(worker.run())
 
 
 class WorkerManager:
@@ -159,45 +646,95 @@ class WorkerManager:
     Manages multiple worker processes.
     """
 
-    def __init__(self):
-        """Initialize worker manager."""
+    def __init__(self, config: Optional[Config] = None):
+        """
+        Initialize worker manager.
+
+        Args:
+            config: Config instance
+        """
         self.processes = []
         self.pid_file = Path.home() / ".queuectl" / "workers.pid"
+        self.config = config or Config()
+        self._log_listener: Optional[QueueListener] = None
 
-        # ✅ Windows-safe multiprocessing initialization
+        # spawn on Windows (the only option there); elsewhere a fork server
+        # that has already imported the worker code forks each worker, so
+        # workers skip interpreter startup and share its memory copy-on-write
+        self._start_method = "spawn" if sys.platform == "win32" else "forkserver"
         try:
-            multiprocessing.set_start_method("spawn", force=True)
+            multiprocessing.set_start_method(self._start_method, force=True)
         except RuntimeError:
             pass  # already set
 
-    def start_workers(self, count: int) -> None:
-        """Start worker processes."""
+    def start_workers(self, count: int, mode: str = "process") -> None:
+        """
+        Start workers.
+
+        Args:
+            count: Number of workers
+            mode: "process" for one OS process per worker, or "async" for a
+                single process running count workers as asyncio tasks
+
+        Raises:
+            RuntimeError: If workers are already running
+            ValueError: If mode is unknown
+        """
+        if mode not in ("process", "async"):
+            raise ValueError(f"Invalid worker mode: {mode}")
+
         if self._are_workers_running():
             raise RuntimeError("Workers are already running")
 
-        logger.info(f"Starting {count} workers")
+        logger.info(f"Starting {count} workers ({mode} mode)")
 
-        # ✅ Use spawn context explicitly (Windows compatibility)
-        ctx = multiprocessing.get_context("spawn")
+        ctx = multiprocessing.get_context(self._start_method)
+        if self._start_method == "forkserver":
+            ctx.set_forkserver_preload([__name__, Storage.__module__])
         pids = []
 
-        for i in range(count):
+        # Workers send log records here and only this process writes them,
+        # so workers never contend for the output stream
+        log_queue = ctx.Queue()
+        self._log_listener = QueueListener(
+            log_queue, *setup_logging().handlers, respect_handler_level=True
+        )
+        self._log_listener.start()
+
+        # In async mode one process runs every worker slot on its event loop
+        concurrencies = [None] * count if mode == "process" else [count]
+
+        # The first worker leads a process group that the others join, so
+        # stop_workers can signal them all at once
+        pgid = None
+        group_ready = ctx.Event() if hasattr(os, "setpgid") else None
+
+        for i, concurrency in enumerate(concurrencies):
             worker_id = f"worker-{i}-{uuid.uuid4().hex[:8]}"
             process = ctx.Process(
                 target=worker_process,
-                args=(worker_id,)
+                args=(
+                    worker_id, concurrency, pgid,
+                    group_ready if i == 0 else None, log_queue
+                )
             )
             process.start()
             self.processes.append(process)
             pids.append(process.pid)
             logger.info(f"Started worker {worker_id} (PID: {process.pid})")
 
-        self._save_pids(pids)
-        logger.info(f"All {count} workers started")
+            if i == 0 and group_ready is not None:
+                if group_ready.wait(timeout=10):
+                    pgid = process.pid
+                else:
+                    logger.warning("First worker did not start in time; not grouping workers")
+
+        self._save_pids(pids, pgid)
+        logger.info(f"All {count} workers started in {len(pids)} processes")
 
     def stop_workers(self) -> None:
         """Stop all running worker processes."""
-        pids = self._load_pids()
+        pids, pgid = self._load_pid_file()
 
         if not pids:
             logger.warning("No running workers found")
@@ -205,53 +742,223 @@ class WorkerManager:
 
         logger.info(f"Stopping {len(pids)} workers")
 
-        for pid in pids:
-            try:
-                os.kill(pid, signal.SIGTERM)
-                logger.info(f"Sent SIGTERM to worker PID {pid}")
-            except ProcessLookupError:
-                logger.warning(f"Worker PID {pid} not found")
-            except Exception as e:
-                logger.error(f"Error stopping worker PID {pid}: {e}")
-
-        time.sleep(2)
+        if pgid is not None and not self._owns_process_group(pids, pgid):
+            pgid = None  # group is gone (or the number was reused)
 
-        for pid in pids:
+        if pgid is not None:
+            os.killpg(pgid, signal.SIGTERM)
+            logger.info(f"Sent SIGTERM to worker process group {pgid}")
+        else:
+            for pid in pids:
+                try:
+                    os.kill(pid, signal.SIGTERM)
+                    logger.info(f"Sent SIGTERM to worker PID {pid}")
+                except ProcessLookupError:
+                    logger.warning(f"Worker PID {pid} not found")
+                except Exception as e:
+                    logger.error(f"Error stopping worker PID {pid}: {e}")
+
+        # Give workers a chance to finish their current job, but return as
+        # soon as they have all exited
+        timeout = float(self.config.get("worker_stop_timeout", 10.0))
+        survivors = self._wait_for_exit(pids, timeout)
+        if survivors and pgid is not None:
+            logger.warning(
+                f"{len(survivors)} workers did not exit in {timeout}s, "
+                f"killing process group {pgid}"
+            )
             try:
-                os.kill(pid, signal.SIGKILL)
+                os.killpg(pgid, signal.SIGKILL)
             except ProcessLookupError:
                 pass
+        else:
+            for pid in survivors:
+                logger.warning(f"Worker PID {pid} did not exit in {timeout}s, killing")
+                try:
+                    os.kill(pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
 
         if self.pid_file.exists():
             self.pid_file.unlink()
 
         logger.info("All workers stopped")
 
-    def _save_pids(self, pids: list) -> None:
-        """Save worker PIDs to file."""
+    def _wait_for_exit(self, pids: list, timeout: float) -> list:
+        """
+        Wait until the given processes exit or the timeout expires.
+
+        Uses pidfds (Linux 5.3+) so the wait is a single blocking poll;
+        elsewhere falls back to probing with os.kill(pid, 0).
+
+        Args:
+            pids: Process IDs to wait for
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            PIDs still running when the timeout expired
+        """
+        if not hasattr(os, "pidfd_open"):
+            return self._probe_for_exit(pids, timeout)
+
+        fds = {}
+        try:
+            for pid in pids:
+                try:
+                    fds[os.pidfd_open(pid)] = pid
+                except ProcessLookupError:
+                    continue  # already gone
+                except OSError:
+                    # e.g. kernel without pidfd support
+                    return self._probe_for_exit(pids, timeout)
+
+            poller = select.poll()
+            for fd in fds:
+                poller.register(fd, select.POLLIN)
+
+            running = set(fds)
+            deadline = time.monotonic() + timeout
+            while running:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                for fd, _ in poller.poll(remaining * 1000):
+                    poller.unregister(fd)
+                    running.discard(fd)
+
+            return [fds[fd] for fd in running]
+        finally:
+            for fd in fds:
+                os.close(fd)
+
+    def _probe_for_exit(self, pids: list, timeout: float) -> list:
+        """Fallback for _wait_for_exit on platforms without pidfds."""
+        running = list(pids)
+        deadline = time.monotonic() + timeout
+        while running:
+            running = [pid for pid in running if self._pid_alive(pid)]
+            if not running or time.monotonic() >= deadline:
+                break
+            time.sleep(0.05)
+        return running
+
+    @staticmethod
+    def _pid_alive(pid: int) -> bool:
+        """Check whether a process exists."""
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+        return True
+
+    def wait(self) -> None:
+        """
+        Block until the workers started by this manager exit.
+
+        Workers run in their own process group, so Ctrl-C in the terminal
+        only reaches this process. It, SIGTERM and SIGHUP (terminal closed)
+        are turned into a graceful stop_workers(). Worker log records are
+        written out until the workers have exited.
+        """
+        def interrupt(signum, frame):
+            raise KeyboardInterrupt
+
+        previous_handlers = {}
+        if threading.current_thread() is threading.main_thread():
+            for name in ("SIGTERM", "SIGHUP"):
+                if hasattr(signal, name):
+                    signum = getattr(signal, name)
+                    previous_handlers[signum] = signal.signal(signum, interrupt)
+
+        try:
+            try:
+                for process in self.processes:
+                    process.join()
+            except KeyboardInterrupt:
+                self.stop_workers()
+        finally:
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
+            if self._log_listener is not None:
+                self._log_listener.stop()  # flushes queued records
+                self._log_listener = None
+
+    @staticmethod
+    def _owns_process_group(pids: list, pgid: int) -> bool:
+        """Check that at least one worker is still alive in the process group."""
+        for pid in pids:
+            try:
+                if os.getpgid(pid) == pgid:
+                    return True
+            except ProcessLookupError:
+                continue
+        return False
+
+    def _save_pids(self, pids: list, pgid: Optional[int] = None) -> None:
+        """Save worker PIDs, and their process group if any, to file."""
         self.pid_file.parent.mkdir(exist_ok=True)
         with open(self.pid_file, "w") as f:
             for pid in pids:
                 f.write(f"{pid}\n")
+            if pgid is not None:
+                f.write(f"pgid {pgid}\n")
+
+    def _load_pid_file(self) -> Tuple[list, Optional[int]]:
+        """
+        Load worker PIDs and process group from file.
+
+        Returns:
+            Tuple of (PIDs, process group ID or None)
+        """
+        try:
+            with open(self.pid_file, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return [], None
+
+        pids, _, pgid = data.partition(b"pgid")
+        return [int(token) for token in pids.split()], int(pgid) if pgid.strip() else None
 
     def _load_pids(self) -> list:
         """Load worker PIDs from file."""
-        if not self.pid_file.exists():
-            return []
-
-        with open(self.pid_file, "r") as f:
-            return [int(line.strip()) for line in f if line.strip()]
+        return self._load_pid_file()[0]
 
     def _are_workers_running(self) -> bool:
-        """Check if any workers are running."""
+        """
+        Check if any workers are running.
+
+        Uses the Process handles when this manager started the workers,
+        otherwise pidfds from the PID file (Linux 5.3+), falling back to
+        probing with os.kill(pid, 0).
+        """
+        if self.processes:
+            return any(process.is_alive() for process in self.processes)
+
         pids = self._load_pids()
+        if not hasattr(os, "pidfd_open"):
+            return any(self._pid_alive(pid) for pid in pids)
 
         for pid in pids:
             try:
-                os.kill(pid, 0)
-                return True
+                fd = os.pidfd_open(pid)
             except ProcessLookupError:
                 continue
+            except OSError:
+                # e.g. kernel without pidfd support
+                if self._pid_alive(pid):
+                    return True
+                continue
+
+            try:
+                poller = select.poll()
+                poller.register(fd, select.POLLIN)
+                # A pidfd becomes readable once its process has exited
+                if not poller.poll(0):
+                    return True
+            finally:
+                os.close(fd)
 
         return False
 